@@ -14,6 +14,7 @@ from mimiry.exceptions import (
 )
 from mimiry.function import function, Function
 from mimiry.image import Image
+from mimiry.records import SessionRecord, VolumeRecord
 from mimiry.run import run
 
 __version__ = "0.3.2"
@@ -25,6 +26,8 @@ __all__ = [
     "function",
     "Function",
     "Image",
+    "SessionRecord",
+    "VolumeRecord",
     "run",
     "MimiryError",
     "AuthError",
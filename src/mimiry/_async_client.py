@@ -0,0 +1,278 @@
+"""Async sibling of :class:`mimiry._client.MimiryClient`, built on ``httpx.AsyncClient``.
+
+Same endpoints, same return shapes, same errors — every method is just a
+coroutine. Use it to fan out many reads (e.g. polling a fleet of sessions)
+with ``asyncio.gather`` over one pooled connection instead of a thread per
+call::
+
+    async with MimiryAsyncClient(token) as c:
+        sessions = await asyncio.gather(*(c.get_session(i) for i in ids))
+
+HTTP/2 multiplexing is used when the optional ``h2`` package is installed
+(``pip install mimiry[http2]``); otherwise requests share an HTTP/1.1
+keep-alive pool.
+
+The event loop is the caller's. For large fan-outs on Linux/macOS, running
+under uvloop (``pip install mimiry[fast]``, then ``uvloop.run(main())``)
+roughly halves per-task overhead. The loop ``MimiryClient`` runs its batch
+helpers on uses uvloop automatically when it is installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Collection, Iterable
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from mimiry._auth import Token
+from mimiry._client import (
+    _MISS,
+    MimiryClient,
+    _body_or,
+    _encode_json_body,
+    _http2_available,
+    _http_timeout,
+    _RateTracker,
+    _retry_delay,
+    _should_retry,
+    _TTLCache,
+)
+from mimiry.exceptions import SessionError
+
+if TYPE_CHECKING:
+    from typing_extensions import Self  # typing.Self needs 3.11; annotation-only
+
+_json_or_raise = MimiryClient._json_or_raise
+
+
+def _new_event_loop(use_uvloop: bool = True) -> asyncio.AbstractEventLoop:
+    """A fresh event loop — uvloop's libuv-backed one when installed and allowed."""
+    if use_uvloop:
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+async def _gather_or_cancel(aws: Iterable[Awaitable[Any]]) -> list[Any]:
+    """``asyncio.gather`` that cancels and drains the siblings when one awaitable fails.
+
+    A bare ``gather`` leaves them running, and on a loop that outlives the
+    call (``MimiryClient``'s) they would resume — and send requests — during
+    the next, unrelated batch.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class MimiryAsyncClient:
+    """Async client for /api/compute/v1/*. Mirrors :class:`MimiryClient`, retries included."""
+
+    def __init__(
+        self,
+        token: Token,
+        http_timeout: float = 30.0,
+        max_retries: int = 3,
+        max_concurrency: int = 10,
+        catalog_cache_ttl: float = 60.0,
+        compress_requests: bool = False,
+        rate_pacing: bool = True,
+        eager_connect: bool = False,
+    ) -> None:
+        self._token = token
+        self._compute_base = f"{token.api_base}/api/compute/v1"
+        self._http = httpx.AsyncClient(
+            timeout=_http_timeout(http_timeout),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=_http2_available(),
+        )
+        self._max_retries = max_retries
+        self._retry_base = 1.0
+        self._retry_cap = 30.0
+        # Caps in-flight requests for batch helpers like get_sessions() so a
+        # large fan-out doesn't stampede the API (or trip its rate limit).
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        self._catalog_cache = _TTLCache(catalog_cache_ttl)
+        self._compress_requests = compress_requests
+        self.rate_pacing = rate_pacing
+        self._rate = _RateTracker()
+        # With eager_connect, warm-up runs in the background when constructed
+        # inside a running loop; otherwise call ``await warmup()`` yourself.
+        self._warmup_task: asyncio.Task | None = None
+        if eager_connect:
+            try:
+                self._warmup_task = asyncio.get_running_loop().create_task(self.warmup())
+            except RuntimeError:
+                pass  # no running loop to schedule on
+
+    async def warmup(self) -> None:
+        """Open the pooled connection (TCP + TLS) ahead of the first real call. Best-effort."""
+        try:
+            await self._http.head(f"{self._token.api_base}/", timeout=2.0)
+        except httpx.HTTPError:
+            pass
+
+    async def aclose(self) -> None:
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        await self._http.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    @property
+    def token(self) -> Token:
+        return self._token
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self._token.get()}",
+            "Content-Type": "application/json",
+        }
+
+    async def _request(
+        self, method: str, path: str, *, no_retry_statuses: Collection[int] = (), **kwargs: Any
+    ) -> httpx.Response:
+        url = f"{self._compute_base}{path}"
+        extra_headers = _encode_json_body(kwargs, self._compress_requests)
+        attempt = 0
+        if self.rate_pacing:
+            pause = self._rate.delay()
+            if pause:
+                await asyncio.sleep(pause)
+        while True:
+            try:
+                resp = await self._http.request(
+                    method, url, headers={**self._headers(), **extra_headers}, **kwargs
+                )
+            except httpx.HTTPError as e:
+                raise SessionError(f"{method} {path} request failed: {e}") from e
+            if self.rate_pacing:
+                self._rate.record(resp)
+            if attempt >= self._max_retries or not _should_retry(
+                method, resp.status_code, no_retry_statuses
+            ):
+                return resp
+            await asyncio.sleep(_retry_delay(attempt, self._retry_base, self._retry_cap, resp))
+            attempt += 1
+
+    # ────────── balance / quota / availability ──────────
+
+    async def get_balance(self) -> dict:
+        return _json_or_raise(await self._request("GET", "/balance"))
+
+    async def get_quota(self) -> dict:
+        return _json_or_raise(await self._request("GET", "/quota"))
+
+    async def get_availability(self, **params: Any) -> dict:
+        """Public endpoint — no auth required. Cached like the sync client's."""
+        body = self._catalog_cache.get("/availability", params)
+        if body is _MISS:
+            body = _json_or_raise(
+                await self._http.get(f"{self._compute_base}/availability", params=params)
+            )
+            self._catalog_cache.put("/availability", params, body)
+        return body
+
+    async def bootstrap(self) -> dict[str, Any]:
+        """Fetch availability, balance and quota concurrently; returns all three by name."""
+        availability, balance, quota = await _gather_or_cancel(
+            [self.get_availability(), self.get_balance(), self.get_quota()]
+        )
+        return {"availability": availability, "balance": balance, "quota": quota}
+
+    # ────────── sessions ──────────
+
+    async def create_session(self, payload: dict) -> dict:
+        """POST /sessions. Returns the initial session object (state=submitted)."""
+        return _json_or_raise(await self._request("POST", "/sessions", json=payload))
+
+    async def get_session(self, session_id: str, *, events_tail: int | None = None) -> dict:
+        params = {}
+        if events_tail is not None:
+            params["events_tail"] = events_tail
+        return _json_or_raise(await self._request("GET", f"/sessions/{session_id}", params=params))
+
+    async def get_sessions(self, session_ids: Iterable[str]) -> list[dict]:
+        """Fetch many sessions concurrently, in the order given.
+
+        At most ``max_concurrency`` requests are in flight at once. The first
+        failure propagates and the fetches still pending are cancelled.
+        """
+
+        async def one(session_id: str) -> dict:
+            async with self._concurrency:
+                return await self.get_session(session_id)
+
+        return await _gather_or_cancel(one(sid) for sid in session_ids)
+
+    async def list_sessions(self, **params: Any) -> list[dict]:
+        body = _json_or_raise(await self._request("GET", "/sessions", params=params))
+        return body.get("sessions", body) if isinstance(body, dict) else body
+
+    async def terminate_session(self, session_id: str) -> dict | None:
+        """DELETE /sessions/{id}. Returns the response body or None on 202/204."""
+        resp = await self._request("DELETE", f"/sessions/{session_id}")
+        if resp.status_code in (202, 204):
+            return None
+        return _json_or_raise(resp)
+
+    async def get_logs(self, session_id: str, *, tail: int = 200, timestamps: bool = False) -> dict:
+        """GET /sessions/{id}/logs. Same ``_status``-tagged shape as the sync client."""
+        resp = await self._request(
+            "GET",
+            f"/sessions/{session_id}/logs",
+            params={"tail": tail, "timestamps": "true" if timestamps else "false"},
+            no_retry_statuses={503},
+        )
+        if resp.status_code == 503:
+            return {"_status": 503, **_body_or(resp, {"retry_after_seconds": 5})}
+        if resp.status_code == 409:
+            return {"_status": 409, **_body_or(resp, {"message": resp.text})}
+        return {"_status": 200, **_json_or_raise(resp)}
+
+    # ────────── volumes ──────────
+
+    async def create_volume(self, payload: dict) -> dict:
+        """POST /volumes. ``payload``: ``{name, size_gb, [provider, location]}``."""
+        return _json_or_raise(await self._request("POST", "/volumes", json=payload))
+
+    async def list_volumes(self, **params: Any) -> list[dict]:
+        body = _json_or_raise(await self._request("GET", "/volumes", params=params))
+        return body.get("volumes", body) if isinstance(body, dict) else body
+
+    async def get_volume(self, volume_id: str) -> dict:
+        return _json_or_raise(await self._request("GET", f"/volumes/{volume_id}"))
+
+    async def extend_volume(self, volume_id: str, size_gb: int) -> dict:
+        """PATCH /volumes/{id} with a larger ``size_gb`` (volumes can't shrink)."""
+        return _json_or_raise(
+            await self._request("PATCH", f"/volumes/{volume_id}", json={"size_gb": size_gb})
+        )
+
+    async def delete_volume(self, volume_id: str) -> dict | None:
+        """DELETE /volumes/{id}. Returns the body, or None on 202/204."""
+        resp = await self._request("DELETE", f"/volumes/{volume_id}")
+        if resp.status_code in (202, 204):
+            return None
+        return _json_or_raise(resp)
+
+    # ────────── transactions ──────────
+
+    async def get_transactions(self, **params: Any) -> Any:
+        """GET /transactions — account credit/debit history."""
+        return _json_or_raise(await self._request("GET", "/transactions", params=params))
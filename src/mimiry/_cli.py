@@ -28,7 +28,7 @@ from mimiry import __version__
 from mimiry._auth import get_token
 from mimiry._client import MimiryClient
 from mimiry._config import configure, get_config
-from mimiry._session import TERMINAL_STATES, _extract_state
+from mimiry._session import TERMINAL_STATES, _extract_state, _sleep_until_next_poll
 from mimiry._ssh import _common_ssh_opts, ssh_target_from_session
 
 # Durable states that mean a session/volume is over (not running, not billing).
@@ -289,6 +289,7 @@ def _wait_for_started(client: MimiryClient, session_id: str) -> dict:
     cfg = get_config()
     deadline = time.monotonic() + cfg.timeout_seconds
     last = None
+    attempt = 0
     while time.monotonic() < deadline:
         payload = client.get_session(session_id)
         state = _extract_state(payload)
@@ -297,7 +298,8 @@ def _wait_for_started(client: MimiryClient, session_id: str) -> dict:
             last = state
         if state == "started" or state in TERMINAL_STATES:
             return payload
-        time.sleep(cfg.poll_interval_seconds)
+        _sleep_until_next_poll(attempt, cfg.poll_interval_seconds, deadline, payload)
+        attempt += 1
     return client.get_session(session_id)
 
 
@@ -306,6 +308,7 @@ def _wait_for_terminal(client: MimiryClient, session_id: str) -> dict:
     cfg = get_config()
     deadline = time.monotonic() + cfg.timeout_seconds
     last = None
+    attempt = 0
     while time.monotonic() < deadline:
         payload = client.get_session(session_id)
         state = _extract_state(payload)
@@ -314,7 +317,8 @@ def _wait_for_terminal(client: MimiryClient, session_id: str) -> dict:
             last = state
         if state in TERMINAL_STATES:
             return payload
-        time.sleep(cfg.poll_interval_seconds)
+        _sleep_until_next_poll(attempt, cfg.poll_interval_seconds, deadline, payload)
+        attempt += 1
     return client.get_session(session_id)
 
 
@@ -6,24 +6,300 @@ state transitions, scanning logs for sentinels) live in ``_session.py``.
 
 from __future__ import annotations
 
-from typing import Any
+import copy
+import importlib.util
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection, Iterable
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from mimiry._auth import Token
 from mimiry.exceptions import SessionError
+from mimiry.records import SessionRecord, VolumeRecord
 
+if TYPE_CHECKING:
+    import asyncio
 
-class MimiryClient:
-    """Thin client for /api/v1/* and /api/compute/v1/*."""
+# Optional Rust-backed codec: pip install mimiry[fast]. The fallback matches
+# httpx's own encoder (UTF-8, non-str dict keys stringified, NaN/Infinity
+# rejected with ValueError). orjson is told to stringify keys too, but it
+# writes NaN/Infinity as ``null`` — never invalid JSON either way.
+try:
+    import orjson
+except ImportError:
+    import json
+
+    _HAS_ORJSON = False
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        ).encode()
+else:
+    _HAS_ORJSON = True
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``pip install mimiry[http2]``)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _body_or(resp: httpx.Response, fallback: Any) -> Any:
+    """Decode ``resp``'s JSON body, or return ``fallback`` if it isn't JSON."""
+    try:
+        return _loads(resp.content)
+    except ValueError:
+        return fallback
+
+
+# Below this a JSON body isn't worth compressing. Above it — typically a
+# session whose env carries a pickled function payload — gzip pays off.
+_GZIP_MIN_BYTES = 4096
+
+
+def _encode_json_body(kwargs: dict[str, Any], compress: bool) -> dict[str, str]:
+    """Swap a ``json=`` kwarg for pre-encoded ``content=`` bytes, in place.
+
+    Encoding once up front means retries reuse the same bytes. Returns extra
+    request headers (``Content-Encoding`` when the body was gzipped).
+    """
+    if "json" not in kwargs:
+        return {}
+    data = _dumps(kwargs.pop("json"))
+    if compress and len(data) > _GZIP_MIN_BYTES:
+        import gzip  # opt-in path; keep it off the CLI's import graph
+
+        kwargs["content"] = gzip.compress(data, compresslevel=6)
+        return {"Content-Encoding": "gzip"}
+    kwargs["content"] = data
+    return {}
+
+
+def _http_timeout(read: float) -> httpx.Timeout:
+    """Fail fast on connect/pool waits; give the server ``read`` seconds to answer."""
+    return httpx.Timeout(connect=5.0, read=read, write=10.0, pool=5.0)
+
+
+# A 5xx may have been partly applied server-side, so only methods that are
+# safe to replay are retried on it — a retried POST /sessions could launch
+# (and bill) a second GPU. A 429 means the request was turned away untouched,
+# so it is retried for any method.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _should_retry(method: str, status_code: int, no_retry_statuses: Collection[int] = ()) -> bool:
+    if status_code in no_retry_statuses:
+        return False
+    if status_code == 429:
+        return True
+    return status_code >= 500 and method in _IDEMPOTENT_METHODS
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Numeric ``Retry-After`` in seconds, or ``None`` (absent, or HTTP-date form)."""
+    value = resp.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _retry_delay(attempt: int, base: float, cap: float, resp: httpx.Response) -> float:
+    """Seconds to wait before retry ``attempt + 1``.
+
+    Honours a numeric ``Retry-After`` header (capped at ``cap``); otherwise
+    exponential backoff with full jitter: ``uniform(0, min(cap, base * 2**attempt))``.
+    """
+    retry_after = _retry_after(resp)
+    if retry_after is not None:
+        return min(cap, retry_after)
+    return min(cap, base * 2**attempt) * random.random()
+
+
+class _RateTracker:
+    """Sliding-window record of recent responses, used to pace *first* attempts.
+
+    Backoff only slows retries; under a shared, saturated quota every new call
+    would still go out blind and eat a 429. Once more than ``threshold`` of the
+    last ``window`` seconds' responses were 429s, new requests first wait
+    ``min(cap, alpha * ratio * last_retry_after)``.
+    """
+
+    def __init__(
+        self, window: float = 60.0, threshold: float = 0.1, alpha: float = 1.0, cap: float = 10.0
+    ) -> None:
+        self.window = window
+        self.threshold = threshold
+        self.alpha = alpha
+        self.cap = cap
+        self._events: deque[tuple[float, bool]] = deque()  # (monotonic ts, was_429)
+        self._throttled = 0
+        self._last_retry_after = 1.0
+
+    def _trim(self, now: float) -> None:
+        while self._events and now - self._events[0][0] > self.window:
+            _, throttled = self._events.popleft()
+            self._throttled -= throttled
+
+    def record(self, resp: httpx.Response) -> None:
+        now = time.monotonic()
+        self._trim(now)
+        throttled = resp.status_code == 429
+        self._events.append((now, throttled))
+        self._throttled += throttled
+        if throttled:
+            retry_after = _retry_after(resp)
+            if retry_after is not None:
+                self._last_retry_after = retry_after
+
+    def delay(self) -> float:
+        self._trim(time.monotonic())
+        if not self._events:
+            return 0.0
+        ratio = self._throttled / len(self._events)
+        if ratio <= self.threshold:
+            return 0.0
+        return min(self.cap, self.alpha * ratio * self._last_retry_after)
+
+
+_MISS = object()
+
+
+class _TTLCache:
+    """In-process cache for slowly-changing catalog reads, keyed by ``(path, params)``.
+
+    ``ttl <= 0`` disables it: nothing is keyed or stored. Hits are deep-copied
+    so callers can't mutate the cached payload.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[float, Any]] = {}
+
+    @staticmethod
+    def _key(path: str, params: dict[str, Any]) -> tuple[str, str]:
+        # Encoded the way httpx sends them, so list values (repeated query
+        # params) are hashable and equal params map to the same entry.
+        return (path, str(httpx.QueryParams(dict(sorted(params.items())))))
+
+    def get(self, path: str, params: dict[str, Any]) -> Any:
+        if self.ttl <= 0:
+            return _MISS
+        entry = self._entries.get(self._key(path, params))
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return _MISS
+        return copy.deepcopy(entry[1])
+
+    def fetched_at(self, path: str, params: dict[str, Any]) -> float | None:
+        """``time.monotonic()`` at which the entry was stored, or ``None`` if absent."""
+        entry = self._entries.get(self._key(path, params)) if self.ttl > 0 else None
+        return entry[0] if entry is not None else None
+
+    def put(self, path: str, params: dict[str, Any], value: Any) -> None:
+        if self.ttl > 0:
+            self._entries[self._key(path, params)] = (time.monotonic(), copy.deepcopy(value))
 
-    def __init__(self, token: Token, http_timeout: float = 30.0) -> None:
+    def pop(self, path: str, params: dict[str, Any]) -> None:
+        if self.ttl > 0:
+            self._entries.pop(self._key(path, params), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class MimiryClient:
+    """Thin client for /api/v1/* and /api/compute/v1/*.
+
+    Responses with a transient status (429, or 5xx on idempotent methods) are
+    retried up to ``max_retries`` times with jittered exponential backoff.
+    Availability reads are cached for ``catalog_cache_ttl`` seconds (``0``
+    disables the cache). With ``return_records=True`` the session/volume
+    getters return :mod:`mimiry.records` objects instead of dicts — the SDK's
+    own polling helpers expect dicts, so leave it off for clients you pass to them.
+    ``compress_requests=True`` gzips JSON bodies over 4 KB; only enable it
+    against a backend that accepts ``Content-Encoding: gzip`` uploads.
+    While ``rate_pacing`` is on, new requests are delayed when recent
+    responses show the account being rate-limited (see ``_RateTracker``).
+    Batch helpers (:meth:`get_sessions`) keep at most ``max_concurrency``
+    requests in flight, on a private event loop that uses uvloop when it is
+    installed and ``enable_uvloop`` is left on. ``eager_connect=True`` opens
+    the pooled connection during construction (see :meth:`warmup`).
+    """
+
+    def __init__(
+        self,
+        token: Token,
+        http_timeout: float = 30.0,
+        max_retries: int = 3,
+        catalog_cache_ttl: float = 60.0,
+        return_records: bool = False,
+        compress_requests: bool = False,
+        rate_pacing: bool = True,
+        max_concurrency: int = 10,
+        eager_connect: bool = False,
+        enable_uvloop: bool = True,
+    ) -> None:
         self._token = token
         self._compute_base = f"{token.api_base}/api/compute/v1"
-        self._http = httpx.Client(timeout=http_timeout)
+        self._http_timeout = http_timeout
+        # One long-lived pool per client: keep-alive connections are reused
+        # across calls (multiplexed over one TLS session when h2 is present),
+        # and only the read phase gets the caller's long timeout.
+        self._http = httpx.Client(
+            timeout=_http_timeout(http_timeout),
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+            ),
+            http2=_http2_available(),
+        )
+        self._max_retries = max_retries
+        self._retry_base = 1.0
+        self._retry_cap = 30.0
+        self._catalog_cache = _TTLCache(catalog_cache_ttl)
+        # GPU name/family → availability models, built from one unfiltered fetch.
+        self._avail_index: dict[str, list[dict]] | None = None
+        self._avail_index_at = 0.0
+        self._return_records = return_records
+        self._compress_requests = compress_requests
+        self._rate_pacing = rate_pacing
+        self._rate = _RateTracker()
+        # Batch helpers run on one private event loop + async client, created on
+        # first use and reused until close(), so repeated calls don't pay loop
+        # setup or a fresh connection pool each time.
+        self._max_concurrency = max_concurrency
+        self._enable_uvloop = enable_uvloop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._async: Any = None  # MimiryAsyncClient, bound to self._loop
+        if eager_connect:
+            self.warmup()
+
+    def warmup(self) -> None:
+        """Open the pooled connection (TCP + TLS) now, so the first real call doesn't pay for it.
+
+        Best-effort: a failed or slow warm-up is ignored.
+        """
+        try:
+            self._http.head(f"{self._token.api_base}/", timeout=2.0)
+        except httpx.HTTPError:
+            pass
 
     def close(self) -> None:
         self._http.close()
+        if self._loop is not None:
+            if self._async is not None:
+                self._loop.run_until_complete(self._async.aclose())
+            self._loop.close()
+            self._loop = self._async = None
 
     def __enter__(self) -> "MimiryClient":
         return self
@@ -35,29 +311,81 @@ class MimiryClient:
     def token(self) -> Token:
         return self._token
 
+    @property
+    def rate_pacing(self) -> bool:
+        return self._rate_pacing
+
+    @rate_pacing.setter
+    def rate_pacing(self, enabled: bool) -> None:
+        self._rate_pacing = enabled
+        if self._async is not None:
+            self._async.rate_pacing = enabled
+
     def _headers(self) -> dict[str, str]:
         return {
             "Authorization": f"Bearer {self._token.get()}",
             "Content-Type": "application/json",
         }
 
-    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+    def _run_async(self, call: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Run ``call(async_client)`` to completion on this client's persistent loop.
+
+        Blocks, so it must not be called from inside a running event loop.
+        """
+        # Imported here, not at module level: avoids an import cycle and keeps
+        # asyncio (~10ms) off the CLI's import path.
+        from mimiry._async_client import MimiryAsyncClient, _new_event_loop
+
+        if self._loop is None:
+            self._loop = _new_event_loop(self._enable_uvloop)
+        if self._async is None:
+            self._async = MimiryAsyncClient(
+                self._token,
+                http_timeout=self._http_timeout,
+                max_retries=self._max_retries,
+                max_concurrency=self._max_concurrency,
+                catalog_cache_ttl=self._catalog_cache.ttl,
+                compress_requests=self._compress_requests,
+                rate_pacing=self.rate_pacing,
+            )
+            # One 429 window for both transports, so throttling seen by batch
+            # helpers paces sync calls too (and vice versa).
+            self._async._rate = self._rate
+        return self._loop.run_until_complete(call(self._async))
+
+    def _request(
+        self, method: str, path: str, *, no_retry_statuses: Collection[int] = (), **kwargs: Any
+    ) -> httpx.Response:
         url = f"{self._compute_base}{path}"
-        try:
-            resp = self._http.request(method, url, headers=self._headers(), **kwargs)
-        except httpx.HTTPError as e:
-            raise SessionError(f"{method} {path} request failed: {e}") from e
-        return resp
+        extra_headers = _encode_json_body(kwargs, self._compress_requests)
+        attempt = 0
+        if self.rate_pacing:
+            pause = self._rate.delay()
+            if pause:
+                time.sleep(pause)
+        while True:
+            try:
+                resp = self._http.request(
+                    method, url, headers={**self._headers(), **extra_headers}, **kwargs
+                )
+            except httpx.HTTPError as e:
+                raise SessionError(f"{method} {path} request failed: {e}") from e
+            if self.rate_pacing:
+                self._rate.record(resp)
+            if attempt >= self._max_retries or not _should_retry(
+                method, resp.status_code, no_retry_statuses
+            ):
+                return resp
+            time.sleep(_retry_delay(attempt, self._retry_base, self._retry_cap, resp))
+            attempt += 1
 
     @staticmethod
     def _json_or_raise(resp: httpx.Response) -> Any:
-        if resp.status_code >= 400:
-            try:
-                body = resp.json()
-            except Exception:
-                body = resp.text[:500]
-            raise SessionError(f"HTTP {resp.status_code} on {resp.request.url}: {body}")
-        return resp.json()
+        # Success exits on a single comparison; error details are only built on failure.
+        if resp.status_code < 400:
+            return _loads(resp.content)
+        detail = _body_or(resp, resp.text[:500])
+        raise SessionError(f"HTTP {resp.status_code} on {resp.request.url}: {detail}")
 
     # ────────── balance / quota / availability ──────────
 
@@ -68,8 +396,61 @@ class MimiryClient:
         return self._json_or_raise(self._request("GET", "/quota"))
 
     def get_availability(self, **params: Any) -> dict:
-        """Public endpoint — no auth required, but it's convenient to call from the client."""
-        return self._json_or_raise(self._http.get(f"{self._compute_base}/availability", params=params))
+        """Public endpoint — no auth required, but it's convenient to call from the client.
+
+        Served from the per-client catalog cache when a fresh entry exists.
+        """
+        body = self._catalog_cache.get("/availability", params)
+        if body is _MISS:
+            body = self._json_or_raise(
+                self._http.get(f"{self._compute_base}/availability", params=params)
+            )
+            self._catalog_cache.put("/availability", params, body)
+        return body
+
+    def prefetch_availability(self) -> None:
+        """Fetch the full availability list once and index it by GPU name and family."""
+        data = self.get_availability()
+        # A cache hit may already be nearly ``ttl`` old; age the index from the fetch.
+        self._index_availability(data, self._catalog_cache.fetched_at("/availability", {}))
+
+    def _index_availability(self, data: Any, fetched_at: float | None = None) -> None:
+        models = data.get("gpu_models") if isinstance(data, dict) else None
+        index: dict[str, list[dict]] = {}
+        for model in models or []:
+            for key in {model.get("name"), model.get("family")} - {None}:
+                index.setdefault(key, []).append(model)
+        self._avail_index = index
+        self._avail_index_at = time.monotonic() if fetched_at is None else fetched_at
+
+    def refresh_availability(self) -> None:
+        """Drop the cached availability (and its index) and fetch it again."""
+        self._catalog_cache.pop("/availability", {})
+        self._avail_index = None
+        self.prefetch_availability()
+
+    def check_availability(self, gpu: str) -> list[dict]:
+        """Availability models matching ``gpu`` by name (``"H100_SXM"``) or family (``"H100"``).
+
+        Answered from the local index while it is fresher than ``catalog_cache_ttl``;
+        otherwise the index is rebuilt first. Returns ``[]`` for an unknown GPU.
+        """
+        age = time.monotonic() - self._avail_index_at
+        if self._avail_index is None or age >= self._catalog_cache.ttl:
+            self.prefetch_availability()
+        return copy.deepcopy(self._avail_index.get(gpu, []))
+
+    def bootstrap(self) -> dict[str, Any]:
+        """Fetch availability, balance and quota concurrently; returns all three by name.
+
+        Over HTTP/2 the three requests share one connection, so start-up costs
+        about one round-trip instead of three. The availability payload also
+        seeds the catalog cache and the :meth:`check_availability` index.
+        """
+        result = self._run_async(lambda client: client.bootstrap())
+        self._catalog_cache.put("/availability", {}, result["availability"])
+        self._index_availability(copy.deepcopy(result["availability"]))
+        return result
 
     # ────────── sessions ──────────
 
@@ -77,15 +458,29 @@ class MimiryClient:
         """POST /sessions. Returns the initial session object (state=submitted)."""
         return self._json_or_raise(self._request("POST", "/sessions", json=payload))
 
-    def get_session(self, session_id: str, *, events_tail: int | None = None) -> dict:
+    def get_session(
+        self, session_id: str, *, events_tail: int | None = None
+    ) -> dict | SessionRecord:
         params = {}
         if events_tail is not None:
             params["events_tail"] = events_tail
-        return self._json_or_raise(self._request("GET", f"/sessions/{session_id}", params=params))
+        body = self._json_or_raise(self._request("GET", f"/sessions/{session_id}", params=params))
+        return SessionRecord.from_dict(body) if self._return_records else body
+
+    def get_sessions(self, session_ids: Iterable[str]) -> list[dict] | list[SessionRecord]:
+        """Fetch many sessions concurrently, in the order given.
 
-    def list_sessions(self, **params: Any) -> list[dict]:
+        Synchronous façade over :meth:`MimiryAsyncClient.get_sessions` — it runs
+        on the client's private event loop, so call it from synchronous code only.
+        """
+        ids = list(session_ids)
+        sessions = self._run_async(lambda client: client.get_sessions(ids))
+        return [SessionRecord.from_dict(s) for s in sessions] if self._return_records else sessions
+
+    def list_sessions(self, **params: Any) -> list[dict] | list[SessionRecord]:
         body = self._json_or_raise(self._request("GET", "/sessions", params=params))
-        return body.get("sessions", body) if isinstance(body, dict) else body
+        sessions = body.get("sessions", body) if isinstance(body, dict) else body
+        return [SessionRecord.from_dict(s) for s in sessions] if self._return_records else sessions
 
     def terminate_session(self, session_id: str) -> dict | None:
         """DELETE /sessions/{id}. Returns the response body or None on 202/204."""
@@ -101,24 +496,19 @@ class MimiryClient:
         ``{"retry_after_seconds": N}`` on 503 (container still booting).
 
         Caller is responsible for retry/backoff loops — see :func:`mimiry._session.wait_for_marker`.
+        A 503 here is a "still booting" signal, so it is returned, not retried;
+        a 429 is retried like any other call.
         """
         resp = self._request(
             "GET",
             f"/sessions/{session_id}/logs",
             params={"tail": tail, "timestamps": "true" if timestamps else "false"},
+            no_retry_statuses={503},
         )
         if resp.status_code == 503:
-            try:
-                body = resp.json()
-            except Exception:
-                body = {"retry_after_seconds": 5}
-            return {"_status": 503, **body}
+            return {"_status": 503, **_body_or(resp, {"retry_after_seconds": 5})}
         if resp.status_code == 409:
-            try:
-                body = resp.json()
-            except Exception:
-                body = {"message": resp.text}
-            return {"_status": 409, **body}
+            return {"_status": 409, **_body_or(resp, {"message": resp.text})}
         return {"_status": 200, **self._json_or_raise(resp)}
 
     # ────────── volumes ──────────
@@ -127,12 +517,14 @@ class MimiryClient:
         """POST /volumes. ``payload``: ``{name, size_gb, [provider, location]}``."""
         return self._json_or_raise(self._request("POST", "/volumes", json=payload))
 
-    def list_volumes(self, **params: Any) -> list[dict]:
+    def list_volumes(self, **params: Any) -> list[dict] | list[VolumeRecord]:
         body = self._json_or_raise(self._request("GET", "/volumes", params=params))
-        return body.get("volumes", body) if isinstance(body, dict) else body
+        volumes = body.get("volumes", body) if isinstance(body, dict) else body
+        return [VolumeRecord.from_dict(v) for v in volumes] if self._return_records else volumes
 
-    def get_volume(self, volume_id: str) -> dict:
-        return self._json_or_raise(self._request("GET", f"/volumes/{volume_id}"))
+    def get_volume(self, volume_id: str) -> dict | VolumeRecord:
+        body = self._json_or_raise(self._request("GET", f"/volumes/{volume_id}"))
+        return VolumeRecord.from_dict(body) if self._return_records else body
 
     def extend_volume(self, volume_id: str, size_gb: int) -> dict:
         """PATCH /volumes/{id} with a larger ``size_gb`` (volumes can't shrink)."""
@@ -7,9 +7,10 @@ this in v2.
 
 from __future__ import annotations
 
+import math
 import time
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from typing import Callable
 
 from mimiry._client import MimiryClient
 from mimiry._config import Config
@@ -19,6 +20,10 @@ TERMINAL_STATES = {"completed", "terminated", "failed", "stopped", "provision_fa
 ERROR_STATES = {"failed", "provision_failed", "stopped"}
 RUNNING_STATE = "started"  # Mimiry's state for "container running"
 
+# Early state polls come quickly so a fast transition isn't padded by a whole
+# interval; once the ladder runs out we settle at the configured cadence.
+_POLL_DELAYS = (0.5, 1.0, 2.0, 5.0)
+
 
 @dataclass
 class SessionRun:
@@ -39,6 +44,35 @@ def _extract_state(payload: dict) -> str:
     return payload.get("state") or payload.get("status") or "unknown"
 
 
+def _poll_delay(attempt: int, poll_interval: float, payload: dict | None = None) -> float:
+    """Seconds to sleep before poll number ``attempt + 1``.
+
+    Walks ``_POLL_DELAYS`` (never exceeding ``poll_interval``), then holds at
+    ``poll_interval``. A server-provided ``next_poll_seconds`` on the payload
+    overrides the schedule, but never polls faster than ``_POLL_DELAYS[0]``;
+    a non-numeric or non-finite hint is ignored.
+    """
+    hint = payload.get("next_poll_seconds") if payload else None
+    if hint is not None:
+        try:
+            delay = float(hint)
+        except (TypeError, ValueError):
+            delay = math.nan
+        if math.isfinite(delay):
+            return max(_POLL_DELAYS[0], delay)
+    if attempt < len(_POLL_DELAYS):
+        return min(_POLL_DELAYS[attempt], poll_interval)
+    return poll_interval
+
+
+def _sleep_until_next_poll(
+    attempt: int, poll_interval: float, deadline: float, payload: dict | None = None
+) -> None:
+    """Sleep per :func:`_poll_delay`, but never past ``deadline``."""
+    delay = _poll_delay(attempt, poll_interval, payload)
+    time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+
+
 def wait_for_started_or_terminal(
     client: MimiryClient,
     session_id: str,
@@ -50,6 +84,7 @@ def wait_for_started_or_terminal(
     last_state = None
     timings: dict[str, float] = {}
     deadline = started_at + config.timeout_seconds
+    attempt = 0
 
     while True:
         if time.monotonic() > deadline:
@@ -72,7 +107,52 @@ def wait_for_started_or_terminal(
         if state in TERMINAL_STATES:
             return payload, timings
 
-        time.sleep(config.poll_interval_seconds)
+        _sleep_until_next_poll(attempt, config.poll_interval_seconds, deadline, payload)
+        attempt += 1
+
+
+def wait_for_sessions(
+    client: MimiryClient,
+    session_ids: Iterable[str],
+    config: Config,
+    on_state_change: Callable[[str, str], None] | None = None,
+) -> dict[str, dict]:
+    """Poll many sessions until every one reaches a terminal state.
+
+    Each tick fetches all still-pending sessions in one concurrent batch
+    (:meth:`MimiryClient.get_sessions`) and drops the ones that finished.
+    ``on_state_change`` gets ``(session_id, state)``. Returns
+    ``{session_id: final_payload}`` in the order given.
+    """
+    order = list(dict.fromkeys(session_ids))
+    pending = list(order)
+    final: dict[str, dict] = {}
+    last_state: dict[str, str] = {}
+    deadline = time.monotonic() + config.timeout_seconds
+    attempt = 0
+
+    while pending:
+        if time.monotonic() > deadline:
+            raise SessionTimeout(
+                f"{len(pending)} session(s) not terminal within {config.timeout_seconds}s: "
+                f"{', '.join(pending)}"
+            )
+
+        for session_id, payload in zip(pending, client.get_sessions(pending)):
+            state = _extract_state(payload)
+            if state != last_state.get(session_id):
+                last_state[session_id] = state
+                if on_state_change:
+                    on_state_change(session_id, state)
+            if state in TERMINAL_STATES:
+                final[session_id] = payload
+
+        pending = [sid for sid in pending if sid not in final]
+        if pending:
+            _sleep_until_next_poll(attempt, config.poll_interval_seconds, deadline)
+            attempt += 1
+
+    return {sid: final[sid] for sid in order}
 
 
 def wait_for_marker(
@@ -154,6 +234,7 @@ def wait_for_ssh_ready(
     """
     deadline = time.monotonic() + max_wait_seconds
     last_state: str | None = None
+    attempt = 0
     while True:
         if time.monotonic() > deadline:
             raise SessionTimeout(
@@ -169,7 +250,8 @@ def wait_for_ssh_ready(
         ssh = payload.get("ssh") or {}
         if ssh.get("host") and ssh.get("port"):
             return payload
-        time.sleep(min(config.poll_interval_seconds, 3.0))
+        _sleep_until_next_poll(attempt, min(config.poll_interval_seconds, 3.0), deadline, payload)
+        attempt += 1
 
 
 def fetch_events(client: MimiryClient, session_id: str) -> list:
@@ -0,0 +1,53 @@
+"""Typed, slotted snapshots of API objects — opt in with ``MimiryClient(return_records=True)``.
+
+The client returns plain dicts by default (the API payload, untouched). The
+records here are a lighter alternative for callers that hold many sessions or
+volumes in memory: ``__slots__`` instead of a per-instance dict, attribute
+access instead of ``.get``, and only the fields the SDK knows about.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any
+
+
+def _known(cls: type, payload: dict) -> dict[str, Any]:
+    return {f.name: payload.get(f.name) for f in fields(cls)}
+
+
+@dataclass(slots=True, frozen=True)
+class SessionRecord:
+    id: str
+    state: str
+    name: str | None = None
+    stop_reason: str | None = None
+    created_at: str | None = None
+    error: str | None = None
+    ssh: dict | None = None
+    events: list | None = None
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> SessionRecord:
+        """Build from a session payload. Unknown keys are dropped."""
+        values = _known(cls, payload)
+        # Same fallback as _session._extract_state: ``state`` is durable, ``status`` isn't.
+        values["state"] = payload.get("state") or payload.get("status") or "unknown"
+        return cls(**values)
+
+
+@dataclass(slots=True, frozen=True)
+class VolumeRecord:
+    id: str
+    state: str | None = None
+    name: str | None = None
+    size_gb: int | None = None
+    attached_to: str | None = None
+    provider: str | None = None
+    location: str | None = None
+    created_at: str | None = None
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> VolumeRecord:
+        """Build from a volume payload. Unknown keys are dropped."""
+        return cls(**_known(cls, payload))
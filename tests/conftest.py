@@ -0,0 +1,48 @@
+"""Shared fixtures for client tests.
+
+HTTP is served by an ``httpx.MockTransport`` so no network happens.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from mimiry._async_client import MimiryAsyncClient
+from mimiry._auth import Token
+from mimiry._client import MimiryClient
+
+
+@pytest.fixture
+def token() -> Token:
+    """A token that won't expire mid-test, pointed at a fake API base."""
+    return Token(
+        access_token="jwt",
+        expires_at=time.time() + 3600,
+        fingerprint="SHA256:x",
+        ssh_key_path=Path("/nonexistent"),
+        api_base="https://api.test",
+    )
+
+
+@pytest.fixture
+def mock_client(token):
+    """``mock_client(handler, **kwargs)`` → a MimiryClient whose HTTP goes to ``handler``."""
+    def _make(handler, **kwargs) -> MimiryClient:
+        c = MimiryClient(token, **kwargs)
+        c._http = httpx.Client(transport=httpx.MockTransport(handler))
+        return c
+    return _make
+
+
+@pytest.fixture
+def mock_async_client(token):
+    """``mock_async_client(handler, **kwargs)`` → the MimiryAsyncClient equivalent."""
+    def _make(handler, **kwargs) -> MimiryAsyncClient:
+        c = MimiryAsyncClient(token, **kwargs)
+        c._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return c
+    return _make
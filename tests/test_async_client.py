@@ -0,0 +1,260 @@
+"""Tests for MimiryAsyncClient: same verbs/paths/shapes as the sync client.
+
+Each test drives the coroutines with ``asyncio.run``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import types
+
+import httpx
+import pytest
+
+from mimiry._async_client import MimiryAsyncClient, _new_event_loop
+from mimiry._client import MimiryClient
+from mimiry.exceptions import SessionError
+
+
+def test_get_session_sends_auth_and_path(mock_async_client):
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": "s1", "state": "started"})
+
+    async def go():
+        async with mock_async_client(handler) as c:
+            return await c.get_session("s1", events_tail=5)
+
+    out = asyncio.run(go())
+    assert out == {"id": "s1", "state": "started"}
+    req = seen[0]
+    assert req.url.path == "/api/compute/v1/sessions/s1"
+    assert req.url.params["events_tail"] == "5"
+    assert req.headers["Authorization"] == "Bearer jwt"
+
+
+def test_create_volume_posts_json(mock_async_client):
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": "v1"})
+
+    async def go():
+        async with mock_async_client(handler) as c:
+            return await c.create_volume({"name": "data", "size_gb": 100})
+
+    assert asyncio.run(go())["id"] == "v1"
+    assert seen[0].method == "POST" and seen[0].url.path == "/api/compute/v1/volumes"
+    assert json.loads(seen[0].content) == {"name": "data", "size_gb": 100}
+
+
+def test_gather_fans_out_concurrently(mock_async_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        sid = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"id": sid, "state": "started"})
+
+    async def go():
+        async with mock_async_client(handler) as c:
+            return await asyncio.gather(*(c.get_session(f"s{i}") for i in range(5)))
+
+    assert [s["id"] for s in asyncio.run(go())] == [f"s{i}" for i in range(5)]
+
+
+def test_logs_503_is_tagged_not_raised(mock_async_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, json={"retry_after_seconds": 7})
+
+    async def go():
+        async with mock_async_client(handler) as c:
+            return await c.get_logs("s1")
+
+    assert asyncio.run(go()) == {"_status": 503, "retry_after_seconds": 7}
+
+
+def test_logs_429_is_retried(monkeypatch, mock_async_client):
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    responses = iter([httpx.Response(429), httpx.Response(200, json={"logs": "ok"})])
+
+    async def go():
+        async with mock_async_client(lambda r: next(responses)) as c:
+            return await c.get_logs("s1")
+
+    assert asyncio.run(go()) == {"_status": 200, "logs": "ok"}
+
+
+def test_terminate_202_returns_none(mock_async_client):
+    async def go():
+        async with mock_async_client(lambda r: httpx.Response(202)) as c:
+            return await c.terminate_session("s1")
+
+    assert asyncio.run(go()) is None
+
+
+def test_get_sessions_preserves_order_and_caps_concurrency(mock_async_client):
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    async def go():
+        async with mock_async_client(handler, max_concurrency=3) as c:
+            return await c.get_sessions([f"s{i}" for i in range(10)])
+
+    out = asyncio.run(go())
+    assert [s["id"] for s in out] == [f"s{i}" for i in range(10)]
+    assert peak == 3
+
+
+def test_failed_batch_leaves_no_pending_tasks(token, mock_async_client):
+    sent: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sid = request.url.path.rsplit("/", 1)[-1]
+        sent.append(sid)
+        if sid == "bad":
+            return httpx.Response(404, json={"error": "no such session"})
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": sid})
+
+    c = MimiryClient(token)
+    c._async = mock_async_client(handler, max_concurrency=2)
+    with pytest.raises(SessionError, match="no such session"):
+        c.get_sessions(["bad"] + [f"s{i}" for i in range(6)])
+    assert not [t for t in asyncio.all_tasks(c._loop) if not t.done()]
+
+    sent.clear()
+    assert c.get_sessions(["x"]) == [{"id": "x"}]
+    assert sent == ["x"]
+    c.close()
+
+
+def test_sync_get_sessions_facade(monkeypatch, token):
+    async def fake_get_sessions(self, session_ids):
+        return [{"id": sid} for sid in session_ids]
+
+    monkeypatch.setattr(MimiryAsyncClient, "get_sessions", fake_get_sessions)
+    with MimiryClient(token) as c:
+        assert c.get_sessions(["a", "b"]) == [{"id": "a"}, {"id": "b"}]
+
+
+def test_sync_facade_reuses_loop_and_client_until_close(monkeypatch, token):
+    loops: list[asyncio.AbstractEventLoop] = []
+    clients: list[MimiryAsyncClient] = []
+
+    async def fake_get_sessions(self, session_ids):
+        loops.append(asyncio.get_running_loop())
+        clients.append(self)
+        return []
+
+    monkeypatch.setattr(MimiryAsyncClient, "get_sessions", fake_get_sessions)
+    c = MimiryClient(token)
+    c.get_sessions(["a"])
+    c.get_sessions(["b"])
+    loop = c._loop
+    assert loops[0] is loops[1] is loop
+    assert clients[0] is clients[1]
+
+    c.close()
+    assert loop.is_closed() and c._loop is None
+    assert clients[0]._http.is_closed
+
+
+BOOTSTRAP_BODIES = {
+    "/api/compute/v1/availability": {"gpu_models": [{"name": "T4", "family": "T4"}]},
+    "/api/compute/v1/balance": {"balance": 10},
+    "/api/compute/v1/quota": {"max_sessions": 2},
+}
+
+
+def test_bootstrap_fetches_startup_reads_together(mock_async_client):
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json=BOOTSTRAP_BODIES[request.url.path])
+
+    async def go():
+        async with mock_async_client(handler) as c:
+            return await c.bootstrap()
+
+    out = asyncio.run(go())
+    assert out == {
+        "availability": BOOTSTRAP_BODIES["/api/compute/v1/availability"],
+        "balance": {"balance": 10},
+        "quota": {"max_sessions": 2},
+    }
+    assert sorted(seen) == sorted(BOOTSTRAP_BODIES)
+
+
+def test_sync_bootstrap_seeds_availability_cache_and_index(mock_async_client, token):
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json=BOOTSTRAP_BODIES[request.url.path])
+
+    with MimiryClient(token) as c:
+        c._http = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(500)))
+        c._async = mock_async_client(handler)
+        c.bootstrap()
+        assert c.get_availability() == BOOTSTRAP_BODIES["/api/compute/v1/availability"]
+        assert [m["name"] for m in c.check_availability("T4")] == ["T4"]
+    assert len(seen) == 3  # nothing went over the sync transport
+
+
+def test_eager_connect_schedules_warmup_inside_running_loop(mock_async_client, token):
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return httpx.Response(200)
+
+    async def go():
+        c = mock_async_client(handler, eager_connect=True)
+        assert c._warmup_task is not None
+        await c._warmup_task
+        await c.aclose()
+
+    asyncio.run(go())
+    assert seen == ["HEAD"]
+    assert MimiryAsyncClient(token, eager_connect=True)._warmup_task is None  # no loop
+
+
+def test_new_event_loop_prefers_uvloop_when_installed(monkeypatch):
+    made: list[asyncio.AbstractEventLoop] = []
+
+    def fake_new_event_loop():
+        loop = asyncio.new_event_loop()
+        made.append(loop)
+        return loop
+
+    fake_uvloop = types.SimpleNamespace(new_event_loop=fake_new_event_loop)
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+    loop = _new_event_loop()
+    assert made == [loop]
+    loop.close()
+
+    plain = _new_event_loop(use_uvloop=False)
+    assert made == [loop]
+    plain.close()
+
+
+def test_new_event_loop_falls_back_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # import raises ImportError
+    loop = _new_event_loop()
+    assert isinstance(loop, asyncio.AbstractEventLoop)
+    loop.close()
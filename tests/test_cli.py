@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import argparse
 import json
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -341,3 +343,10 @@ def test_help_subcommand_prints_full_help(capsys):
 def test_bare_invocation_prints_help(capsys):
     assert cli.main([]) == 0
     assert "usage: mimiry" in capsys.readouterr().out
+
+
+def test_cli_import_stays_lean():
+    """Every CLI invocation pays the import graph; batch/compression-only deps stay lazy."""
+    code = "import sys, mimiry._cli; print(sorted({'asyncio', 'gzip'} & set(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
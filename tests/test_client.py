@@ -0,0 +1,254 @@
+"""Tests for MimiryClient behaviour beyond verb/path mapping: caching and decoding."""
+
+from __future__ import annotations
+
+import gzip
+
+import httpx
+import pytest
+
+import mimiry._client as client_mod
+from mimiry._client import MimiryClient
+from mimiry.exceptions import SessionError
+
+AVAILABILITY = {"gpu_models": [{"name": "T4", "family": "T4", "available": True}]}
+
+
+def _counting_handler(body):
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=body)
+
+    return handler, seen
+
+
+# ────────────────────────── catalog cache ──────────────────────────
+
+
+def test_availability_cached_per_params(mock_client):
+    handler, seen = _counting_handler(AVAILABILITY)
+    c = mock_client(handler)
+    assert c.get_availability() == AVAILABILITY
+    assert c.get_availability() == AVAILABILITY
+    assert len(seen) == 1
+    c.get_availability(gpu_family="T4")
+    c.get_availability(gpu_family="T4")
+    assert len(seen) == 2
+
+
+def test_availability_cache_expires(monkeypatch, mock_client):
+    handler, seen = _counting_handler(AVAILABILITY)
+    c = mock_client(handler, catalog_cache_ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: now[0])
+    c.get_availability()
+    now[0] += 9
+    c.get_availability()
+    assert len(seen) == 1
+    now[0] += 2
+    c.get_availability()
+    assert len(seen) == 2
+
+
+def test_availability_cache_disabled_with_zero_ttl(mock_client):
+    handler, seen = _counting_handler(AVAILABILITY)
+    c = mock_client(handler, catalog_cache_ttl=0)
+    c.get_availability()
+    c.get_availability()
+    assert len(seen) == 2
+
+
+def test_availability_cache_accepts_list_params(mock_client):
+    handler, seen = _counting_handler(AVAILABILITY)
+    c = mock_client(handler)
+    c.get_availability(provider=["gcp", "verda"])
+    c.get_availability(provider=["gcp", "verda"])
+    assert len(seen) == 1
+    assert seen[0].url.params.get_list("provider") == ["gcp", "verda"]
+
+    c = mock_client(handler, catalog_cache_ttl=0)
+    c.get_availability(provider=["gcp", "verda"])
+    assert len(seen) == 2
+
+
+def test_cached_availability_is_isolated_from_caller_mutation(mock_client):
+    handler, _ = _counting_handler(AVAILABILITY)
+    c = mock_client(handler)
+    c.get_availability()["gpu_models"].clear()
+    assert c.get_availability() == AVAILABILITY
+
+
+# ────────────────────────── response decoding ──────────────────────────
+
+
+def test_responses_decoded_with_module_loads(monkeypatch, mock_client):
+    decoded: list[bytes] = []
+    real = client_mod._loads
+
+    def spy(data):
+        decoded.append(bytes(data))
+        return real(data)
+
+    monkeypatch.setattr(client_mod, "_loads", spy)
+    handler, _ = _counting_handler({"balance": 12.5})
+    assert mock_client(handler).get_balance() == {"balance": 12.5}
+    assert len(decoded) == 1
+
+
+def test_gzip_response_decoded_from_bytes_once(monkeypatch, mock_client):
+    """httpx inflates gzip into ``.content``; we parse those bytes directly, never ``.text``."""
+    decoded: list[object] = []
+    real = client_mod._loads
+
+    def spy(data):
+        decoded.append(data)
+        return real(data)
+
+    monkeypatch.setattr(client_mod, "_loads", spy)
+    packed = gzip.compress(b'{"gpu_models":[]}')
+    c = mock_client(lambda r: httpx.Response(200, headers={"Content-Encoding": "gzip"}, content=packed))
+    assert c.get_availability() == {"gpu_models": []}
+    assert decoded == [b'{"gpu_models":[]}']
+
+
+def test_error_body_decoded_into_message(mock_client):
+    c = mock_client(lambda r: httpx.Response(404, json={"error": "no such session"}))
+    with pytest.raises(SessionError, match="no such session"):
+        c.get_session("nope")
+
+
+# ────────────────────────── request encoding ──────────────────────────
+
+
+def test_json_body_sent_as_pre_encoded_bytes(mock_client):
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": "v1"})
+
+    mock_client(handler).create_volume({"name": "data", "size_gb": 100})
+    req = seen[0]
+    assert req.content == b'{"name":"data","size_gb":100}'
+    assert req.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.skipif(client_mod._HAS_ORJSON, reason="orjson installed")
+def test_stdlib_encoder_rejects_nan_and_keeps_utf8():
+    with pytest.raises(ValueError):
+        client_mod._dumps({"x": float("nan")})
+    assert client_mod._dumps({"name": "å"}) == '{"name":"å"}'.encode()
+    assert client_mod._dumps({1: "a"}) == b'{"1":"a"}'
+
+
+@pytest.mark.skipif(not client_mod._HAS_ORJSON, reason="orjson not installed")
+def test_orjson_encoder_stringifies_keys_like_stdlib():
+    assert client_mod._dumps({1: "a"}) == b'{"1":"a"}'
+    assert client_mod._dumps({"x": float("nan")}) == b'{"x":null}'
+
+
+def test_non_json_error_bodies_fall_back(mock_client):
+    c = mock_client(lambda r: httpx.Response(502, text="<html>bad gateway</html>"), max_retries=0)
+    with pytest.raises(SessionError, match="bad gateway"):
+        c.get_balance()
+    c = mock_client(lambda r: httpx.Response(503, text="booting"))
+    assert c.get_logs("s1") == {"_status": 503, "retry_after_seconds": 5}
+
+
+# ────────────────────────── availability index ──────────────────────────
+
+MODELS = {
+    "gpu_models": [
+        {"name": "T4", "family": "T4", "available": True},
+        {"name": "H100_SXM", "family": "H100", "available": True},
+        {"name": "H100_PCIE", "family": "H100", "available": False},
+    ]
+}
+
+
+def test_check_availability_answers_point_queries_from_one_fetch(mock_client):
+    handler, seen = _counting_handler(MODELS)
+    c = mock_client(handler)
+    assert [m["name"] for m in c.check_availability("H100")] == ["H100_SXM", "H100_PCIE"]
+    assert [m["name"] for m in c.check_availability("T4")] == ["T4"]
+    assert c.check_availability("B200") == []
+    assert len(seen) == 1
+
+
+def test_refresh_availability_bypasses_cache(mock_client):
+    handler, seen = _counting_handler(MODELS)
+    c = mock_client(handler)
+    c.check_availability("T4")
+    c.refresh_availability()
+    c.check_availability("T4")
+    assert len(seen) == 2
+
+
+def test_availability_index_goes_stale_with_catalog_ttl(monkeypatch, mock_client):
+    handler, seen = _counting_handler(MODELS)
+    c = mock_client(handler, catalog_cache_ttl=10)
+    now = [1000.0]
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: now[0])
+    c.check_availability("T4")
+    now[0] += 11
+    c.check_availability("T4")
+    assert len(seen) == 2
+
+
+def test_availability_index_ages_from_fetch_not_from_indexing(monkeypatch, mock_client):
+    handler, seen = _counting_handler(MODELS)
+    c = mock_client(handler, catalog_cache_ttl=60)
+    now = [0.0]
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: now[0])
+    c.get_availability()
+    now[0] = 59.0
+    c.check_availability("T4")  # indexed from the 59s-old cache entry
+    assert len(seen) == 1
+    now[0] = 61.0
+    c.check_availability("T4")
+    assert len(seen) == 2
+
+
+def test_large_body_gzipped_only_when_enabled(mock_client):
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"id": "s1"})
+
+    big = {"environment_vars": {"MIMIRY_PAYLOAD": "x" * 10_000}}
+    mock_client(handler).create_session(big)
+    mock_client(handler, compress_requests=True).create_session({"name": "small"})
+    mock_client(handler, compress_requests=True).create_session(big)
+
+    plain, small, packed = seen
+    assert "Content-Encoding" not in plain.headers
+    assert "Content-Encoding" not in small.headers
+    assert packed.headers["Content-Encoding"] == "gzip"
+    assert len(packed.content) < len(plain.content)
+    assert gzip.decompress(packed.content) == plain.content
+
+
+# ────────────────────────── connection warm-up ──────────────────────────
+
+
+def test_warmup_heads_api_base_and_swallows_errors(mock_client):
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        raise httpx.ConnectError("unreachable")
+
+    mock_client(handler).warmup()  # no raise
+    assert seen[0].method == "HEAD" and str(seen[0].url) == "https://api.test/"
+
+
+def test_eager_connect_warms_up_in_init(monkeypatch, token):
+    calls: list[MimiryClient] = []
+    monkeypatch.setattr(MimiryClient, "warmup", lambda self: calls.append(self))
+    MimiryClient(token)
+    assert calls == []
+    c = MimiryClient(token, eager_connect=True)
+    assert calls == [c]
@@ -0,0 +1,163 @@
+"""Tests for status-aware retries and 429-driven pacing in MimiryClient._request.
+
+Responses are scripted per test and ``time.sleep`` is captured, so the tests
+are instant and assert the exact backoff the client chose.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+import mimiry._client as client_mod
+from mimiry._client import MimiryClient, _RateTracker, _retry_delay
+from mimiry.exceptions import SessionError
+
+
+@pytest.fixture
+def scripted(mock_client):
+    """``scripted(responses, seen)`` → a client answering with ``responses`` in order."""
+    def _make(responses: list[httpx.Response], seen: list[httpx.Request]) -> MimiryClient:
+        it = iter(responses)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return next(it)
+
+        return mock_client(handler)
+    return _make
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls: list[float] = []
+    monkeypatch.setattr(client_mod.time, "sleep", calls.append)
+    return calls
+
+
+def test_429_then_success_honours_retry_after(sleeps, scripted):
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(429, headers={"Retry-After": "2"}),
+                  httpx.Response(200, json={"balance": 1})], seen)
+    assert c.get_balance() == {"balance": 1}
+    assert len(seen) == 2
+    assert sleeps == [2.0]
+
+
+def test_5xx_get_retried_with_jittered_backoff(sleeps, monkeypatch, scripted):
+    monkeypatch.setattr(client_mod.random, "random", lambda: 0.5)
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(502), httpx.Response(503),
+                  httpx.Response(200, json={"id": "s1"})], seen)
+    assert c.get_session("s1") == {"id": "s1"}
+    assert sleeps == [0.5, 1.0]  # 0.5 * min(30, 1 * 2**attempt)
+
+
+def test_gives_up_after_max_retries(sleeps, scripted):
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(500)] * 4, seen)
+    with pytest.raises(SessionError, match="HTTP 500"):
+        c.get_quota()
+    assert len(seen) == 4  # 1 + max_retries
+    assert len(sleeps) == 3
+
+
+def test_5xx_post_not_retried(sleeps, scripted):
+    """A 5xx on POST /sessions may have launched a GPU — never replay it."""
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(500), httpx.Response(200, json={"id": "dup"})], seen)
+    with pytest.raises(SessionError, match="HTTP 500"):
+        c.create_session({"name": "x"})
+    assert len(seen) == 1 and sleeps == []
+
+
+def test_429_post_is_retried(sleeps, scripted):
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(429), httpx.Response(200, json={"id": "s1"})], seen)
+    assert c.create_session({"name": "x"})["id"] == "s1"
+    assert len(seen) == 2
+
+
+def test_logs_503_returned_not_retried(sleeps, scripted):
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(503, json={"retry_after_seconds": 4})], seen)
+    assert c.get_logs("s1") == {"_status": 503, "retry_after_seconds": 4}
+    assert len(seen) == 1 and sleeps == []
+
+
+def test_logs_429_is_retried(sleeps, scripted):
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(429, headers={"Retry-After": "0"}),
+                  httpx.Response(200, json={"logs": "ok"})], seen)
+    assert c.get_logs("s1") == {"_status": 200, "logs": "ok"}
+    assert len(seen) == 2 and sleeps == [0.0]
+
+
+def test_retry_delay_is_capped():
+    resp = httpx.Response(503)
+    assert _retry_delay(10, 1.0, 30.0, resp) <= 30.0
+    assert _retry_delay(0, 1.0, 30.0, httpx.Response(429, headers={"Retry-After": "900"})) == 30.0
+    http_date = httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+    assert 0.0 <= _retry_delay(0, 1.0, 30.0, http_date) <= 1.0
+
+
+# ────────────────────────── adaptive pacing ──────────────────────────
+
+
+def test_rate_tracker_paces_only_above_threshold(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: now[0])
+    rt = _RateTracker()
+    for _ in range(19):
+        rt.record(httpx.Response(200))
+    rt.record(httpx.Response(429, headers={"Retry-After": "4"}))
+    assert rt.delay() == 0.0  # 1/20 = 5% — below the 10% threshold
+    rt.record(httpx.Response(429, headers={"Retry-After": "4"}))
+    rt.record(httpx.Response(429, headers={"Retry-After": "4"}))
+    assert rt.delay() == pytest.approx(3 / 22 * 4)
+
+
+def test_rate_tracker_forgets_outside_window(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: now[0])
+    rt = _RateTracker(window=60.0)
+    rt.record(httpx.Response(429, headers={"Retry-After": "100"}))
+    assert rt.delay() == 10.0  # capped
+    now[0] = 61.0
+    assert rt.delay() == 0.0
+
+
+def test_client_paces_first_attempt_after_429s(sleeps, scripted):
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(429, headers={"Retry-After": "2"}),
+                  httpx.Response(200, json={}),
+                  httpx.Response(200, json={})], seen)
+    c.get_balance()  # 429 → retry after 2s
+    assert sleeps == [2.0]
+    c.get_balance()  # 1 of 2 recent responses throttled → paced before sending
+    assert sleeps == [2.0, pytest.approx(0.5 * 2.0)]
+
+
+def test_client_pacing_can_be_disabled(sleeps, scripted):
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(429, headers={"Retry-After": "2"}),
+                  httpx.Response(200, json={}),
+                  httpx.Response(200, json={})], seen)
+    c.rate_pacing = False
+    c.get_balance()
+    c.get_balance()
+    assert sleeps == [2.0]
+
+
+def test_batch_helpers_share_pacing_state_with_sync_calls(sleeps, scripted):
+    seen: list[httpx.Request] = []
+    c = scripted([httpx.Response(429, headers={"Retry-After": "2"}),
+                  httpx.Response(200, json={})], seen)
+    c.get_balance()
+    c._run_async(lambda client: asyncio.sleep(0))  # builds the async client
+    assert c._async._rate is c._rate and c._async.rate_pacing
+    c.rate_pacing = False
+    assert not c._async.rate_pacing
+    c.close()
@@ -6,6 +6,7 @@ method/path/json the client would send (matching the mirc.sh endpoints).
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 import pytest
@@ -18,6 +19,10 @@ class _FakeResp:
         self.status_code = status_code
         self._body = body if body is not None else {}
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._body).encode()
+
     def json(self):
         return self._body
 
@@ -35,6 +40,7 @@ def client(monkeypatch):
     c._request = fake_request  # type: ignore[attr-defined]
     c._calls = calls  # type: ignore[attr-defined]
     c._next_resp = _FakeResp(200, {})  # type: ignore[attr-defined]
+    c._return_records = False
     return c
 
 
@@ -0,0 +1,48 @@
+"""Tests for the opt-in slotted records (``MimiryClient(return_records=True)``)."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from mimiry.records import SessionRecord, VolumeRecord
+
+
+def test_session_record_keeps_known_fields_only():
+    rec = SessionRecord.from_dict(
+        {"id": "s1", "state": "started", "name": "job", "ssh": {"host": "h"}, "extra": 1}
+    )
+    assert rec == SessionRecord(id="s1", state="started", name="job", ssh={"host": "h"})
+    assert not hasattr(rec, "__dict__")  # slotted
+    assert not hasattr(rec, "extra")
+
+
+def test_session_record_falls_back_to_status():
+    assert SessionRecord.from_dict({"id": "s1", "status": "failed"}).state == "failed"
+    assert SessionRecord.from_dict({"id": "s1"}).state == "unknown"
+
+
+def test_records_are_frozen():
+    rec = VolumeRecord.from_dict({"id": "v1", "size_gb": 100})
+    assert rec.size_gb == 100 and rec.attached_to is None
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        rec.size_gb = 200  # type: ignore[misc]
+
+
+def test_client_wraps_responses_when_opted_in(monkeypatch):
+    from mimiry._client import MimiryClient
+
+    c = MimiryClient.__new__(MimiryClient)
+    c._return_records = True
+    bodies = {
+        "/sessions/s1": {"id": "s1", "state": "started"},
+        "/sessions": {"sessions": [{"id": "s1", "state": "started"}]},
+        "/volumes": {"volumes": [{"id": "v1", "size_gb": 10}]},
+    }
+    monkeypatch.setattr(c, "_request", lambda method, path, **kw: bodies[path], raising=False)
+    monkeypatch.setattr(MimiryClient, "_json_or_raise", staticmethod(lambda body: body))
+
+    assert c.get_session("s1") == SessionRecord(id="s1", state="started")
+    assert c.list_sessions() == [SessionRecord(id="s1", state="started")]
+    assert c.list_volumes() == [VolumeRecord(id="v1", size_gb=10)]
@@ -1,10 +1,18 @@
-"""Tests for terminal-state failure surfacing (raise_if_ended_before_result)."""
+"""Tests for terminal-state failure surfacing and the state-poll schedule."""
 
 from __future__ import annotations
 
 import pytest
 
-from mimiry._session import raise_if_ended_before_result
+import mimiry._session as session_mod
+from mimiry._config import Config
+from mimiry._session import (
+    _poll_delay,
+    raise_if_ended_before_result,
+    wait_for_marker,
+    wait_for_sessions,
+    wait_for_started_or_terminal,
+)
 from mimiry.exceptions import SessionFailed
 
 
@@ -59,3 +67,105 @@ def test_raises_gracefully_when_logs_unavailable():
             {"id": "s2", "state": "stopped", "stop_reason": "timed_out"}, client=client
         )
     assert exc.value.state == "stopped"  # still raises, just without a log tail
+
+
+# ────────────────────────── poll schedule ──────────────────────────
+
+
+def test_poll_delay_escalates_then_holds_at_interval():
+    assert [_poll_delay(i, 10.0) for i in range(6)] == [0.5, 1.0, 2.0, 5.0, 10.0, 10.0]
+
+
+def test_poll_delay_never_exceeds_interval():
+    assert [_poll_delay(i, 1.5) for i in range(5)] == [0.5, 1.0, 1.5, 1.5, 1.5]
+
+
+def test_poll_delay_honours_server_hint():
+    assert _poll_delay(0, 10.0, {"next_poll_seconds": 3}) == 3.0
+    assert _poll_delay(0, 10.0, {"next_poll_seconds": "junk"}) == 0.5
+    # A hint can slow polling down but never remove the sleep.
+    assert _poll_delay(3, 10.0, {"next_poll_seconds": 0}) == 0.5
+    assert _poll_delay(3, 10.0, {"next_poll_seconds": -4}) == 0.5
+    assert _poll_delay(3, 10.0, {"next_poll_seconds": "nan"}) == 5.0
+    assert _poll_delay(5, 10.0, {"next_poll_seconds": float("inf")}) == 10.0
+
+
+class _StateClient:
+    def __init__(self, states):
+        self._states = iter(states)
+
+    def get_session(self, session_id, *, events_tail=None):
+        return {"id": session_id, "state": next(self._states)}
+
+
+def test_wait_for_started_uses_escalating_sleeps(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(session_mod.time, "sleep", sleeps.append)
+    client = _StateClient(["submitted", "provisioning", "provisioning", "started"])
+    cfg = Config(timeout_seconds=60, poll_interval_seconds=5.0)
+
+    payload, _ = wait_for_started_or_terminal(client, "s1", cfg)
+
+    assert payload["state"] == "started"
+    assert sleeps == [0.5, 1.0, 2.0]
+
+
+class _FleetClient:
+    """Each session walks its own list of states, one step per batch poll."""
+
+    def __init__(self, states: dict[str, list[str]]):
+        self._states = {sid: iter(seq) for sid, seq in states.items()}
+        self.batches: list[list[str]] = []
+
+    def get_sessions(self, session_ids):
+        self.batches.append(list(session_ids))
+        return [{"id": sid, "state": next(self._states[sid])} for sid in session_ids]
+
+
+def test_wait_for_sessions_drops_finished_sessions(monkeypatch):
+    monkeypatch.setattr(session_mod.time, "sleep", lambda s: None)
+    client = _FleetClient({
+        "a": ["provisioning", "completed"],
+        "b": ["provisioning", "started", "failed"],
+    })
+    changes: list[tuple[str, str]] = []
+    cfg = Config(timeout_seconds=60, poll_interval_seconds=5.0)
+
+    final = wait_for_sessions(client, ["a", "b"], cfg,
+                              on_state_change=lambda sid, st: changes.append((sid, st)))
+
+    assert list(final) == ["a", "b"]
+    assert final["a"]["state"] == "completed" and final["b"]["state"] == "failed"
+    assert client.batches == [["a", "b"], ["a", "b"], ["b"]]
+    assert ("b", "started") in changes
+
+
+class _LogClient:
+    def __init__(self, log_responses):
+        self._logs = iter(log_responses)
+        self.calls: list[tuple] = []
+
+    def get_logs(self, session_id, *, tail: int = 200, timestamps: bool = False):
+        self.calls.append(("logs", session_id, tail))
+        return next(self._logs)
+
+    def get_session(self, session_id, *, events_tail=None):
+        self.calls.append(("session", session_id))
+        return {"id": session_id, "state": "started"}
+
+
+def test_wait_for_marker_returns_once_marker_logged(monkeypatch):
+    monkeypatch.setattr(session_mod.time, "sleep", lambda s: None)
+    client = _LogClient([
+        {"_status": 503, "retry_after_seconds": 1},
+        {"_status": 200, "logs": "booting\n"},
+        {"_status": 200, "logs": "booting\n__DONE__\n"},
+    ])
+    cfg = Config(timeout_seconds=60)
+
+    logs, payload, timings = wait_for_marker(client, "s1", "__DONE__", cfg, log_tail=50)
+
+    assert "__DONE__" in logs and payload["state"] == "started"
+    assert "marker_found" in timings
+    assert all(c[1] == "s1" for c in client.calls)
+    assert [c[2] for c in client.calls if c[0] == "logs"] == [50, 50, 50]